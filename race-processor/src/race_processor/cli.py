@@ -129,6 +129,12 @@ def main() -> None:
     default=0.12,
     help="Confidence threshold for blur detection (default: 0.12)",
 )
+@click.option(
+    "--precision",
+    type=click.Choice(["fp16", "fp32"]),
+    default="fp16",
+    help="Detector inference precision; fp16 only applies on CUDA (default: fp16)",
+)
 @click.option(
     "--debug",
     is_flag=True,
@@ -187,6 +193,11 @@ def main() -> None:
     default=0,
     help="Skip the first N images during intake (useful if you started recording before the start line)",
 )
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Re-encode all exports, even WebPs newer than their source and encoded with the current quality/method",
+)
 def process(
     input_dir: Path | None,
     race_slug: str | None,
@@ -199,6 +210,7 @@ def process(
     upload_prefix: str | None,
     blur_mode: str,
     conf: float,
+    precision: str,
     debug: bool,
     debug_format: str,
     start_step: int,
@@ -209,6 +221,7 @@ def process(
     gpx_path: Path | None,
     gpx_offset: float,
     skip_first: int,
+    force: bool,
 ) -> None:
     """Process equirectangular images through the pipeline.
 
@@ -268,12 +281,15 @@ def process(
             end_step=end_step,
             blur_mode=blur_mode,
             blur_conf=conf,
+            blur_precision=precision,
             debug=debug,
             debug_format=debug_format,
             single_image=single_image,
             copyright_text=copyright_text,
             r2_config=r2_config,
             upload_prefix=upload_prefix,
+            force=force,
+            workers=workers,
         )
         return
 
@@ -336,12 +352,13 @@ def process(
         gpx_path=gpx_path,
         gpx_offset=gpx_offset,
         skip_first=skip_first,
+        force=force,
     )
 
     # Import and run orchestrator
     from .pipeline.orchestrator import run_pipeline
 
-    run_pipeline(config, blur_mode=blur_mode, blur_conf=conf)
+    run_pipeline(config, blur_mode=blur_mode, blur_conf=conf, blur_precision=precision)
 
 
 @main.command()
@@ -403,7 +420,15 @@ def intake(input_dir: Path, race_slug: str) -> None:
     default=0.12,
     help="Confidence threshold for detections (default: 0.12)",
 )
-def preview_blur(image_path: Path, output: Path | None, show_sources: bool, blur: bool, conf: float) -> None:
+@click.option(
+    "--precision",
+    type=click.Choice(["fp16", "fp32"]),
+    default="fp16",
+    help="Detector inference precision; fp16 only applies on CUDA (default: fp16)",
+)
+def preview_blur(
+    image_path: Path, output: Path | None, show_sources: bool, blur: bool, conf: float, precision: str
+) -> None:
     """Preview blur detection on a single image.
 
     \b
@@ -433,7 +458,9 @@ def preview_blur(image_path: Path, output: Path | None, show_sources: bool, blur
     console.print(f"  Image size: {image.shape[1]}x{image.shape[0]}")
 
     # Run detection
-    ensemble = PrivacyBlurEnsemble(models_dir=DEFAULT_MODELS_DIR, conf_threshold=conf)
+    ensemble = PrivacyBlurEnsemble(
+        models_dir=DEFAULT_MODELS_DIR, conf_threshold=conf, precision=precision
+    )
     regions = ensemble.detect_all(image)
 
     console.print(f"  Detected {len(regions)} regions (threshold: {conf})")
@@ -577,6 +604,7 @@ def preview_resize(image_path: Path, output_dir: Path | None) -> None:
     console.print(f"[bold]Preview resize for:[/] {image_path}")
 
     from .config import ImageTiersConfig
+    from .pipeline.orchestrator import resize_to_tiers
     import cv2
 
     # Default output directory
@@ -597,17 +625,15 @@ def preview_resize(image_path: Path, output_dir: Path | None) -> None:
     # Get tier config
     tier_config = ImageTiersConfig()
 
-    tiers = {
-        "thumb": tier_config.thumbnail,
-        "medium": tier_config.medium,
-        "full": tier_config.full,
+    tier_widths = {
+        "thumb": tier_config.thumbnail.width,
+        "medium": tier_config.medium.width,
+        "full": tier_config.full.width,
     }
 
-    for tier_name, tier in tiers.items():
-        new_width = tier.width
-        new_height = int(height * (new_width / width))
-
-        resized = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4)
+    # Same tier chain as the pipeline's resize stage
+    for tier_name, resized in resize_to_tiers(image, tier_widths).items():
+        new_height, new_width = resized.shape[:2]
 
         output_path = output_dir / f"{image_path.stem}-{tier_name}.jpg"
         cv2.imwrite(str(output_path), resized)
@@ -649,6 +675,8 @@ def preview_export(image_path: Path, output_dir: Path | None, webp_quality: int)
 
     from PIL import Image
 
+    from .pipeline.export import WEBP_METHOD
+
     # Default output directory
     if output_dir is None:
         output_dir = image_path.parent
@@ -669,7 +697,7 @@ def preview_export(image_path: Path, output_dir: Path | None, webp_quality: int)
 
     # Export WebP
     webp_path = output_dir / f"{image_path.stem}.webp"
-    img.save(webp_path, format="WEBP", quality=webp_quality)
+    img.save(webp_path, format="WEBP", quality=webp_quality, method=WEBP_METHOD, lossless=False)
     webp_size = webp_path.stat().st_size
 
     # Print results
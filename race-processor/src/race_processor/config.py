@@ -193,7 +193,7 @@ class PipelineConfig(BaseModel):
     race_slug: str = Field(description="Race slug for naming")
 
     # Processing settings
-    workers: int = Field(default=4, description="Number of parallel workers")
+    workers: int = Field(default=4, ge=1, description="Number of parallel workers")
     skip_blur: bool = Field(default=False, description="Skip blur stage")
     skip_upload: bool = Field(default=True, description="Skip R2 upload (default: True)")
     upload_prefix: str | None = Field(
@@ -208,6 +208,11 @@ class PipelineConfig(BaseModel):
     # Image filtering
     skip_first: int = Field(default=0, description="Skip the first N images during intake")
 
+    # Incremental export
+    force: bool = Field(
+        default=False, description="Re-encode exports even if outputs are up to date"
+    )
+
     # Component configs
     face_detection: FaceDetectionConfig = Field(default_factory=FaceDetectionConfig)
     body_pose: BodyPoseConfig = Field(default_factory=BodyPoseConfig)
@@ -228,3 +233,6 @@ class PipelineConfig(BaseModel):
 DEFAULT_MODELS_DIR = Path(__file__).parent.parent.parent / "models"
 DEFAULT_DATA_DIR = Path(__file__).parent.parent.parent / "data"
 DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent.parent / "output"
+
+# Source image file extensions picked up by every stage (lowercase)
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".tiff", ".tif")
@@ -6,23 +6,48 @@ the left/right edge seam. Detection is run on both the original image and
 an edge-padded version to catch objects spanning the seam.
 """
 
+import math
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, Optional, Sequence
 
 import cv2
 import numpy as np
+import torch
+from numba import njit
 from rich.console import Console
 from ultralytics import YOLO
 
-from ..config import BlurConfig
+from ..config import IMAGE_EXTENSIONS, BlurConfig
+from ..utils.parallel import map_chunksize, worker_pool
 
 console = Console()
 
 # Percentage of image width to pad for edge detection
 EDGE_PAD_RATIO = 0.15
 
+# Kernel size from which Gaussian blur switches to cv2.stackBlur
+STACK_BLUR_MIN_KERNEL = 31
+
+# ROIs larger than this (px) with a wide kernel are blurred at 1/FACTOR scale
+DOWNSCALED_BLUR_MIN_SIZE = 128
+DOWNSCALED_BLUR_FACTOR = 4
+
+# Images per detector call and I/O threads used by process_blur_batch
+BLUR_BATCH_SIZE = 4
+BLUR_IO_WORKERS = 4
+
+# Threads used by blur_image to blend separate components concurrently
+BLUR_REGION_WORKERS = os.cpu_count() or 1
+
+# Side (px) of the blank frame used to warm up each model after loading
+WARMUP_IMAGE_SIZE = 640
+
 
 class DetectionSource(Enum):
     """Source of a detection."""
@@ -35,9 +60,13 @@ class DetectionSource(Enum):
     EDGE_WRAPPED = "edge_wrapped"
 
 
-@dataclass
+@dataclass(slots=True)
 class BlurRegion:
-    """A region to blur in an image."""
+    """A region to blur in an image.
+
+    Corner coordinates (x1, y1, x2, y2) are derived from the center and size
+    once at construction, so hot paths read them instead of recomputing.
+    """
 
     x: int  # Center x
     y: int  # Center y
@@ -47,9 +76,138 @@ class BlurRegion:
     source: DetectionSource
     # For edge-wrapped regions, this indicates the region spans the edge
     spans_edge: bool = False
+    x1: int = field(init=False, repr=False, compare=False)
+    y1: int = field(init=False, repr=False, compare=False)
+    x2: int = field(init=False, repr=False, compare=False)
+    y2: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.x1 = self.x - self.width // 2
+        self.y1 = self.y - self.height // 2
+        self.x2 = self.x + self.width // 2
+        self.y2 = self.y + self.height // 2
+
+    @classmethod
+    def from_arrays(
+        cls,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        widths: np.ndarray,
+        heights: np.ndarray,
+        confidences: Sequence[float] | np.ndarray,
+        sources: DetectionSource | Sequence[DetectionSource],
+        spans_edge: Sequence[bool] | np.ndarray,
+    ) -> list["BlurRegion"]:
+        """
+        Build many regions from column arrays in one go.
+
+        Corners are computed for the whole batch with NumPy and written
+        straight into the slots, skipping the per-instance ``__init__`` and
+        ``__post_init__`` calls. ``sources`` may be a single DetectionSource
+        shared by every region.
+        """
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        widths = np.asarray(widths, dtype=np.int64)
+        heights = np.asarray(heights, dtype=np.int64)
+        half_w, half_h = widths // 2, heights // 2
+        if isinstance(sources, DetectionSource):
+            sources = repeat(sources)
+
+        columns = zip(
+            xs.tolist(), ys.tolist(), widths.tolist(), heights.tolist(),
+            np.asarray(confidences, dtype=np.float64).tolist(), sources,
+            np.asarray(spans_edge, dtype=bool).tolist(),
+            (xs - half_w).tolist(), (ys - half_h).tolist(),
+            (xs + half_w).tolist(), (ys + half_h).tolist(),
+        )
+
+        regions: list[BlurRegion] = []
+        for x, y, width, height, confidence, source, spans, x1, y1, x2, y2 in columns:
+            region = object.__new__(cls)
+            region.x, region.y, region.width, region.height = x, y, width, height
+            region.confidence, region.source, region.spans_edge = confidence, source, spans
+            region.x1, region.y1, region.x2, region.y2 = x1, y1, x2, y2
+            regions.append(region)
 
+        return regions
 
-def create_edge_padded_image(image: np.ndarray, pad_ratio: float = EDGE_PAD_RATIO) -> tuple[np.ndarray, int]:
+
+# DetectionSource members by int8 code, as stored in BlurRegionArray.sources
+_SOURCE_CODES = tuple(DetectionSource)
+
+
+@dataclass(slots=True)
+class BlurRegionArray:
+    """A collection of regions stored as parallel column arrays.
+
+    Hot paths (edge translation, merging) work on the columns directly;
+    use ``from_regions``/``to_list`` to convert from and to BlurRegion lists.
+    """
+
+    xs: np.ndarray  # (N,) int64 center x
+    ys: np.ndarray  # (N,) int64 center y
+    widths: np.ndarray  # (N,) int64
+    heights: np.ndarray  # (N,) int64
+    confidences: np.ndarray  # (N,) float64
+    sources: np.ndarray  # (N,) int8 index into DetectionSource
+    spans_edge: np.ndarray  # (N,) bool
+
+    @classmethod
+    def from_regions(cls, regions: Sequence[BlurRegion]) -> "BlurRegionArray":
+        """Split regions into column arrays."""
+        count = len(regions)
+        codes = {source: code for code, source in enumerate(_SOURCE_CODES)}
+        return cls(
+            xs=np.fromiter((r.x for r in regions), dtype=np.int64, count=count),
+            ys=np.fromiter((r.y for r in regions), dtype=np.int64, count=count),
+            widths=np.fromiter((r.width for r in regions), dtype=np.int64, count=count),
+            heights=np.fromiter((r.height for r in regions), dtype=np.int64, count=count),
+            confidences=np.fromiter((r.confidence for r in regions), dtype=np.float64, count=count),
+            sources=np.fromiter((codes[r.source] for r in regions), dtype=np.int8, count=count),
+            spans_edge=np.fromiter((r.spans_edge for r in regions), dtype=bool, count=count),
+        )
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def corners(self) -> np.ndarray:
+        """Return an (N, 4) int64 array of x1, y1, x2, y2 corners."""
+        half_w, half_h = self.widths // 2, self.heights // 2
+        return np.stack(
+            [self.xs - half_w, self.ys - half_h, self.xs + half_w, self.ys + half_h], axis=1
+        )
+
+    def take(self, indices: np.ndarray) -> "BlurRegionArray":
+        """Return the regions at ``indices``, in that order."""
+        return BlurRegionArray(
+            xs=self.xs[indices],
+            ys=self.ys[indices],
+            widths=self.widths[indices],
+            heights=self.heights[indices],
+            confidences=self.confidences[indices],
+            sources=self.sources[indices],
+            spans_edge=self.spans_edge[indices],
+        )
+
+    def to_list(self) -> list[BlurRegion]:
+        """Build BlurRegion objects for the rows."""
+        return BlurRegion.from_arrays(
+            self.xs,
+            self.ys,
+            self.widths,
+            self.heights,
+            self.confidences,
+            [_SOURCE_CODES[code] for code in self.sources.tolist()],
+            self.spans_edge,
+        )
+
+
+def create_edge_padded_image(
+    image: np.ndarray,
+    pad_ratio: float = EDGE_PAD_RATIO,
+    out: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, int]:
     """
     Create an edge-padded version of an equirectangular image.
 
@@ -59,18 +217,24 @@ def create_edge_padded_image(image: np.ndarray, pad_ratio: float = EDGE_PAD_RATI
     Args:
         image: Original equirectangular image (BGR format)
         pad_ratio: Ratio of image width to use for padding
+        out: Optional buffer to write the padded image into. Reused when its
+            shape and dtype match, otherwise a new array is allocated.
 
     Returns:
         Tuple of (padded_image, pad_width)
     """
     height, width = image.shape[:2]
     pad_width = int(width * pad_ratio)
+    shape = (height, width + pad_width) + image.shape[2:]
 
-    # Take the left portion of the image
-    left_portion = image[:, :pad_width]
-
-    # Append it to the right side
-    padded = np.concatenate([image, left_portion], axis=1)
+    # Write the image and then its left portion into one buffer, so nothing
+    # is allocated beyond the padded result itself
+    if out is not None and out.shape == shape and out.dtype == image.dtype:
+        padded = out
+    else:
+        padded = np.empty(shape, dtype=image.dtype)
+    padded[:, :width] = image
+    padded[:, width:] = image[:, :pad_width]
 
     return padded, pad_width
 
@@ -98,15 +262,11 @@ def translate_edge_detections(
     translated = []
 
     for region in regions:
-        region_left = region.x - region.width // 2
-        region_right = region.x + region.width // 2
-
         # Check if detection is entirely within the padded area (right side)
-        if region_left >= original_width:
+        if region.x1 >= original_width:
             # Translate to left side of original image
-            new_x = region.x - original_width
             translated.append(BlurRegion(
-                x=new_x,
+                x=region.x - original_width,
                 y=region.y,
                 width=region.width,
                 height=region.height,
@@ -116,14 +276,8 @@ def translate_edge_detections(
             ))
 
         # Check if detection spans the original edge
-        elif region_right > original_width and region_left < original_width:
-            # This detection spans the edge - mark it
-            # Calculate how much is on each side
-            left_width = original_width - region_left
-            right_width = region_right - original_width
-
-            # Create a region that spans the edge (will be handled specially in blur)
-            # Center it at the edge for tracking purposes
+        elif region.x2 > original_width:
+            # Keep it whole and mark it (will be handled specially in blur)
             translated.append(BlurRegion(
                 x=region.x if region.x < original_width else region.x - original_width,
                 y=region.y,
@@ -135,8 +289,8 @@ def translate_edge_detections(
             ))
 
         # Detection is entirely within original image bounds
-        elif region_right <= original_width:
-            # Keep as-is but mark source
+        else:
+            # Keep as-is
             translated.append(BlurRegion(
                 x=region.x,
                 y=region.y,
@@ -205,10 +359,10 @@ def blur_region_on_image(
 
     else:
         # Standard region - blur normally
-        x1 = max(0, region.x - region.width // 2)
-        y1 = max(0, region.y - region.height // 2)
-        x2 = min(width, region.x + region.width // 2)
-        y2 = min(height, region.y + region.height // 2)
+        x1 = max(0, region.x1)
+        y1 = max(0, region.y1)
+        x2 = min(width, region.x2)
+        y2 = min(height, region.y2)
 
         if x2 > x1 and y2 > y1:
             roi = image[y1:y2, x1:x2]
@@ -218,6 +372,50 @@ def blur_region_on_image(
     return image
 
 
+def _gaussian_blur(roi: np.ndarray, kernel_size: int, iterations: int) -> np.ndarray:
+    """
+    Blur a region as if by ``iterations`` passes of a ``kernel_size`` Gaussian.
+
+    Repeated Gaussian passes compose into a single Gaussian whose sigma is
+    scaled by sqrt(iterations), so one wider pass replaces the loop.
+    """
+    if iterations <= 0:
+        return roi.copy()
+
+    # Sigma OpenCV derives for this kernel size when sigma=0 is passed
+    sigma = 0.3 * ((kernel_size - 1) * 0.5 - 1) + 0.8
+    if iterations > 1:
+        sigma *= math.sqrt(iterations)
+        kernel_size = 2 * math.ceil(3 * sigma) + 1
+
+    # Huge region with a wide kernel: blur a downscaled copy with a
+    # proportionally smaller sigma and scale it back up (far fewer pixels
+    # touched; the softening from upscaling is harmless for privacy blur)
+    height, width = roi.shape[:2]
+    factor = DOWNSCALED_BLUR_FACTOR
+    if (
+        max(height, width) > DOWNSCALED_BLUR_MIN_SIZE
+        and min(height, width) >= factor
+        and sigma >= 2 * factor
+    ):
+        small = cv2.resize(roi, (width // factor, height // factor), interpolation=cv2.INTER_AREA)
+        small_sigma = sigma / factor
+        small = _blur_with_sigma(small, 2 * math.ceil(3 * small_sigma) + 1, small_sigma)
+        return cv2.resize(small, (width, height), interpolation=cv2.INTER_LINEAR)
+
+    return _blur_with_sigma(roi, kernel_size, sigma)
+
+
+def _blur_with_sigma(roi: np.ndarray, kernel_size: int, sigma: float) -> np.ndarray:
+    """Run a single Gaussian-equivalent blur, picking the cheapest filter for the kernel."""
+    # Stack blur costs the same per pixel regardless of kernel size and is
+    # visually equivalent for privacy blur
+    if kernel_size >= STACK_BLUR_MIN_KERNEL:
+        return cv2.stackBlur(roi, (kernel_size, kernel_size))
+
+    return cv2.GaussianBlur(roi, (kernel_size, kernel_size), sigma)
+
+
 def _apply_blur_to_roi(
     roi: np.ndarray,
     region: BlurRegion,
@@ -232,10 +430,7 @@ def _apply_blur_to_roi(
         )
         kernel_size = kernel_size + 1 if kernel_size % 2 == 0 else kernel_size
 
-        blurred = roi.copy()
-        for _ in range(config.iterations):
-            blurred = cv2.GaussianBlur(blurred, (kernel_size, kernel_size), 0)
-        return blurred
+        return _gaussian_blur(roi, kernel_size, config.iterations)
 
     else:  # pixelate
         block_size = max(
@@ -254,10 +449,88 @@ def _apply_blur_to_roi(
         )
 
 
+def _blend_component(
+    image: np.ndarray,
+    labels: np.ndarray,
+    label: int,
+    stats: np.ndarray,
+    config: BlurConfig,
+) -> tuple[slice, slice, np.ndarray]:
+    """
+    Blur one connected mask component and feather it into its surroundings.
+
+    Only reads from ``image``; the caller writes the result back.
+
+    Args:
+        image: OpenCV image (BGR format)
+        labels: Label map from cv2.connectedComponentsWithStats
+        label: Component label to process
+        stats: Component stats from cv2.connectedComponentsWithStats
+        config: Blur configuration
+
+    Returns:
+        Row slice, column slice and the blended padded ROI to place there
+    """
+    height, width = image.shape[:2]
+    x, y, w, h, area = stats[label]
+    
+    # Calculate feather size as 5% of the component's largest dimension
+    feather_size = int(max(w, h) * 0.05)
+    feather_size = max(4, feather_size)  # Ensure at least a small feather
+    
+    # Pad the ROI to allow the external feather to bleed out
+    pad = feather_size + 4
+    
+    # Calculate padded coordinates
+    px1 = max(0, x - pad)
+    py1 = max(0, y - pad)
+    px2 = min(width, x + w + pad)
+    py2 = min(height, y + h + pad)
+    
+    # 1. Extract the ROI from the ORIGINAL image and create a local mask
+    roi = image[py1:py2, px1:px2]
+    local_mask = (labels[py1:py2, px1:px2] == label).astype(np.uint8) * 255
+    
+    # 2. Perform the blur on the entire padded ROI
+    # Use the original component dimensions for blur strength
+    component_size = max(w, h)
+    kernel_size = max(
+        config.min_kernel_size,
+        int(component_size * config.kernel_size_factor),
+    )
+    kernel_size = kernel_size + 1 if kernel_size % 2 == 0 else kernel_size
+    
+    blurred_roi = _gaussian_blur(roi, kernel_size, config.iterations)
+
+    # 3. Create the feathered alpha mask using Distance Transform
+    # This makes the interior (original mask) 100% white (1.0) and fades out externally
+    # distanceTransform calculates distance to the nearest zero pixel.
+    # We invert local_mask so it finds distance from the boundary moving outward.
+    dist_outside = cv2.distanceTransform(255 - local_mask, cv2.DIST_L2, 3)
+
+    # Normalize distance to 0.0 - 1.0 range based on feather_size
+    # Inside mask: distance is 0 -> alpha is 1.0
+    # Outside mask: distance increases -> alpha decreases to 0.0
+    alpha_mask = 1.0 - np.clip(dist_outside / feather_size, 0, 1)
+    
+    # Smooth the alpha transition slightly
+    if feather_size > 4:
+        alpha_mask = cv2.GaussianBlur(alpha_mask, (3, 3), 0)
+        
+    alpha_3 = cv2.merge([alpha_mask, alpha_mask, alpha_mask])
+    
+    # 4. Blend the blurred ROI with the original ROI using the alpha mask
+    blended = (blurred_roi.astype(float) * alpha_3 + roi.astype(float) * (1.0 - alpha_3)).astype(np.uint8)
+    
+
+    return slice(py1, py2), slice(px1, px2), blended
+
+
 def blur_image(
     image: np.ndarray,
     regions: list[BlurRegion],
     config: BlurConfig,
+    inplace: bool = False,
 ) -> np.ndarray:
     """
     Apply blur to specified regions in an image.
@@ -269,15 +542,17 @@ def blur_image(
         image: OpenCV image (BGR format)
         regions: List of BlurRegion objects to blur
         config: Blur configuration
+        inplace: Write the blurred regions directly into ``image`` instead
+            of a copy. Use when the caller no longer needs the original.
 
     Returns:
-        Image with blur applied to regions
+        Image with blur applied to regions. When nothing needs blurring the
+        input image itself is returned (not a copy).
     """
     if not regions:
-        return image.copy()
+        return image
 
     height, width = image.shape[:2]
-    result = image.copy()
     
     # 1. Create a single mask for all pixels that need blurring
     mask = np.zeros((height, width), dtype=np.uint8)
@@ -310,75 +585,88 @@ def blur_image(
                 cv2.rectangle(mask, (rx1, y1), (rx2, y2), 255, -1)
         else:
             # Standard region
-            x1 = max(0, region.x - region.width // 2)
-            y1 = max(0, region.y - region.height // 2)
-            x2 = min(width, region.x + region.width // 2)
-            y2 = min(height, region.y + region.height // 2)
+            x1 = max(0, region.x1)
+            y1 = max(0, region.y1)
+            x2 = min(width, region.x2)
+            y2 = min(height, region.y2)
             cv2.rectangle(mask, (x1, y1), (x2, y2), 255, -1)
 
     # 2. Find connected components (groups of overlapping regions)
     num_labels, labels, stats, centroids = cv2.connectedComponentsWithStats(mask)
-    
-    # 3. Process each component (skip background label 0)
-    for i in range(1, num_labels):
-        x, y, w, h, area = stats[i]
-        
-        # Calculate feather size as 5% of the component's largest dimension
-        feather_size = int(max(w, h) * 0.05)
-        feather_size = max(4, feather_size)  # Ensure at least a small feather
-        
-        # Pad the ROI to allow the external feather to bleed out
-        pad = feather_size + 4
-        
-        # Calculate padded coordinates
-        px1 = max(0, x - pad)
-        py1 = max(0, y - pad)
-        px2 = min(width, x + w + pad)
-        py2 = min(height, y + h + pad)
-        
-        # 1. Extract the ROI from the ORIGINAL image and create a local mask
-        roi = image[py1:py2, px1:px2].copy()
-        local_mask = (labels[py1:py2, px1:px2] == i).astype(np.uint8) * 255
-        
-        # 2. Perform the blur on the entire padded ROI
-        # Use the original component dimensions for blur strength
-        component_size = max(w, h)
-        kernel_size = max(
-            config.min_kernel_size,
-            int(component_size * config.kernel_size_factor),
-        )
-        kernel_size = kernel_size + 1 if kernel_size % 2 == 0 else kernel_size
-        
-        blurred_roi = roi.copy()
-        for _ in range(config.iterations):
-            blurred_roi = cv2.GaussianBlur(blurred_roi, (kernel_size, kernel_size), 0)
-
-        # 3. Create the feathered alpha mask using Distance Transform
-        # This makes the interior (original mask) 100% white (1.0) and fades out externally
-        # distanceTransform calculates distance to the nearest zero pixel.
-        # We invert local_mask so it finds distance from the boundary moving outward.
-        dist_outside = cv2.distanceTransform(255 - local_mask, cv2.DIST_L2, 3)
-
-        # Normalize distance to 0.0 - 1.0 range based on feather_size
-        # Inside mask: distance is 0 -> alpha is 1.0
-        # Outside mask: distance increases -> alpha decreases to 0.0
-        alpha_mask = 1.0 - np.clip(dist_outside / feather_size, 0, 1)
-        
-        # Smooth the alpha transition slightly
-        if feather_size > 4:
-            alpha_mask = cv2.GaussianBlur(alpha_mask, (3, 3), 0)
-            
-        alpha_3 = cv2.merge([alpha_mask, alpha_mask, alpha_mask])
-        
-        # 4. Blend the blurred ROI with the original ROI using the alpha mask
-        blended = (blurred_roi.astype(float) * alpha_3 + roi.astype(float) * (1.0 - alpha_3)).astype(np.uint8)
-        
-        # 5. Place the blended result back into the main image
-        result[py1:py2, px1:px2] = blended
-        
+    if num_labels <= 1:
+        # Only vehicle regions (or nothing on-image), leave the frame untouched
+        return image
+
+    # Padded ROIs of neighbouring components can overlap, so every blend is
+    # computed from the original pixels before any of them are written back.
+    # OpenCV releases the GIL, so components are blended on a thread pool.
+    components = range(1, num_labels)  # skip background label 0
+    if len(components) > 1 and BLUR_REGION_WORKERS > 1:
+        workers = min(BLUR_REGION_WORKERS, len(components))
+        # Each blend thread runs OpenCV filters, so split OpenCV's own thread
+        # budget between them while the pool runs; a single component keeps
+        # the full budget for its filters
+        previous_cv_threads = cv2.getNumThreads()
+        cv2.setNumThreads(max(1, previous_cv_threads // workers))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                blends = list(pool.map(
+                    lambda label: _blend_component(image, labels, label, stats, config),
+                    components,
+                ))
+        finally:
+            cv2.setNumThreads(previous_cv_threads)
+    else:
+        blends = [_blend_component(image, labels, label, stats, config) for label in components]
+
+    # 5. Place the blended results back into the output image
+    result = image if inplace else image.copy()
+    for rows, cols, blended in blends:
+        result[rows, cols] = blended
+
     return result
 
 
+@njit(cache=True)
+def _cluster_boxes(boxes: np.ndarray, areas: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """
+    Greedily cluster boxes by IoU (compiled with Numba).
+
+    Args:
+        boxes: (N, 4) int array of x1, y1, x2, y2, sorted largest area first
+        areas: (N,) int array of region areas (width * height)
+        iou_threshold: Minimum IoU for a box to join a cluster
+
+    Returns:
+        (N,) array of cluster labels; each label is the index of the cluster's seed box
+    """
+    n = boxes.shape[0]
+    labels = np.full(n, -1, dtype=np.int64)
+
+    for i in range(n):
+        if labels[i] != -1:
+            continue
+        labels[i] = i
+
+        for j in range(i + 1, n):
+            if labels[j] != -1:
+                continue
+
+            inter_x1 = max(boxes[i, 0], boxes[j, 0])
+            inter_y1 = max(boxes[i, 1], boxes[j, 1])
+            inter_x2 = min(boxes[i, 2], boxes[j, 2])
+            inter_y2 = min(boxes[i, 3], boxes[j, 3])
+            if inter_x2 <= inter_x1 or inter_y2 <= inter_y1:
+                continue
+
+            inter_area = (inter_x2 - inter_x1) * (inter_y2 - inter_y1)
+            union_area = areas[i] + areas[j] - inter_area
+            if union_area > 0 and inter_area / union_area > iou_threshold:
+                labels[j] = i
+
+    return labels
+
+
 class PrivacyBlurEnsemble:
     """
     Runs all detection layers and merges results.
@@ -397,6 +685,7 @@ class PrivacyBlurEnsemble:
         models_dir: Optional[Path] = None,
         edge_aware: bool = True,
         conf_threshold: float = 0.12,
+        precision: Literal["fp32", "fp16"] = "fp16",
     ) -> None:
         """
         Initialize the ensemble.
@@ -408,14 +697,21 @@ class PrivacyBlurEnsemble:
             models_dir: Directory containing YOLO models (required for full mode)
             edge_aware: Whether to run edge-aware detection for equirectangular images
             conf_threshold: Default confidence threshold for detections
+            precision: Inference precision. "fp16" runs the models in half
+                precision when a CUDA device is available and falls back to
+                fp32 on CPU.
         """
         self.mode = mode
         self.models_dir = models_dir
         self.edge_aware = edge_aware
         self.conf_threshold = conf_threshold
+        self.precision = precision
+        self._use_half = precision == "fp16" and torch.cuda.is_available()
         self._models_loaded = False
         self.face_detector = None
         self.plate_detector = None
+        # Edge-padded frame buffers reused across detect_batch calls
+        self._pad_buffers: list[np.ndarray] = []
 
         if mode == "full" and models_dir:
             self._load_models()
@@ -462,34 +758,63 @@ class PrivacyBlurEnsemble:
 
         except Exception as e:
             console.print(f"  [red]Error loading models: {e}[/]")
+            return
+
+        if self._models_loaded:
+            # Models are usable even if warm-up fails; the first image then
+            # pays the setup cost instead
+            try:
+                self._warm_up()
+            except Exception as e:
+                console.print(f"  [yellow]Warning: Model warm-up skipped: {e}[/]")
+
+    def _warm_up(self) -> None:
+        """
+        Run one dummy inference per loaded model.
+
+        The first call pays for predictor setup, layer fusion and backend
+        autotuning; doing it here keeps that cost out of the first image.
+        """
+        dummy = np.zeros((WARMUP_IMAGE_SIZE, WARMUP_IMAGE_SIZE, 3), dtype=np.uint8)
+        for detector in (self.face_detector, self.plate_detector, self.vehicle_detector):
+            if detector is not None:
+                detector(dummy, half=self._use_half, verbose=False)
 
     def _run_detection(
         self,
-        image: np.ndarray,
-    ) -> list[BlurRegion]:
+        images: list[np.ndarray],
+    ) -> list[list[BlurRegion]]:
         """
-        Run detection on a single image (internal method).
+        Run detection on a batch of images (internal method).
+
+        Each YOLO model is called once with the whole batch. Callers pass
+        frames of a single shape, since Ultralytics only letterboxes to the
+        frames' own aspect ratio when every input in a call has the same
+        shape. Plate search crops from every vehicle in the batch are sent to
+        the plate model in one call.
 
         Args:
-            image: OpenCV image (BGR format)
+            images: OpenCV images (BGR format)
 
         Returns:
-            List of BlurRegion objects
+            One list of BlurRegion objects per input image, in input order
         """
-        if not self._models_loaded:
-            return []
+        all_regions: list[list[BlurRegion]] = [[] for _ in images]
 
-        all_regions: list[BlurRegion] = []
+        if not self._models_loaded or not images:
+            return all_regions
 
         # 1. Face Detection
         if self.face_detector:
-            results = self.face_detector(image, conf=self.conf_threshold, verbose=False)
-            for r in results:
+            results = self.face_detector(
+                images, conf=self.conf_threshold, half=self._use_half, verbose=False
+            )
+            for regions, r in zip(all_regions, results):
                 boxes = r.boxes
                 for box in boxes:
                     x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
                     conf = float(box.conf[0])
-                    all_regions.append(
+                    regions.append(
                         BlurRegion(
                             x=int((x1 + x2) / 2),
                             y=int((y1 + y2) / 2),
@@ -503,14 +828,21 @@ class PrivacyBlurEnsemble:
         # 2. Two-Stage Plate Detection (Vehicle -> Plate)
         if self.vehicle_detector and self.plate_detector:
             # Detect vehicles first (COCO: 2=car, 3=motorcycle, 5=bus, 7=truck)
-            v_results = self.vehicle_detector(image, conf=0.3, classes=[2, 3, 5, 7], verbose=False)
-            for v_r in v_results:
+            v_results = self.vehicle_detector(
+                images, conf=0.3, classes=[2, 3, 5, 7], half=self._use_half, verbose=False
+            )
+
+            # Plate search areas and, per crop, (target region list, x offset, y offset)
+            plate_crops: list[np.ndarray] = []
+            plate_origins: list[tuple[list[BlurRegion], int, int]] = []
+
+            for image, regions, v_r in zip(images, all_regions, v_results):
                 for v_box in v_r.boxes:
                     vx1, vy1, vx2, vy2 = v_box.xyxy[0].cpu().numpy().astype(int)
                     v_conf = float(v_box.conf[0])
                     
                     # Add vehicle box to regions (for preview purposes)
-                    all_regions.append(
+                    regions.append(
                         BlurRegion(
                             x=int((vx1 + vx2) / 2),
                             y=int((vy1 + vy2) / 2),
@@ -537,23 +869,30 @@ class PrivacyBlurEnsemble:
                         
                     plate_search_area = vehicle_crop[ignore_top:, :]
                     
-                    # Detect plates within the reduced search area
+                    # Queue the reduced search area; all crops are detected together below
                     if plate_search_area.size > 0:
-                        p_results = self.plate_detector(plate_search_area, conf=self.conf_threshold, verbose=False)
-                        for p_r in p_results:
-                            for p_box in p_r.boxes:
-                                px1, py1, px2, py2 = p_box.xyxy[0].cpu().numpy()
-                                # Translate back to original image coordinates
-                                all_regions.append(
-                                    BlurRegion(
-                                        x=int(cx1 + (px1 + px2) / 2),
-                                        y=int(cy1 + ignore_top + (py1 + py2) / 2),
-                                        width=int(px2 - px1),
-                                        height=int(py2 - py1),
-                                        confidence=float(p_box.conf[0]),
-                                        source=DetectionSource.LICENSE_PLATE,
-                                    )
-                                )
+                        plate_crops.append(plate_search_area)
+                        plate_origins.append((regions, cx1, cy1 + ignore_top))
+
+            # Detect plates in every vehicle crop from the whole batch in one call
+            if plate_crops:
+                p_results = self.plate_detector(
+                    plate_crops, conf=self.conf_threshold, half=self._use_half, verbose=False
+                )
+                for (regions, ox, oy), p_r in zip(plate_origins, p_results):
+                    for p_box in p_r.boxes:
+                        px1, py1, px2, py2 = p_box.xyxy[0].cpu().numpy()
+                        # Translate back to original image coordinates
+                        regions.append(
+                            BlurRegion(
+                                x=int(ox + (px1 + px2) / 2),
+                                y=int(oy + (py1 + py2) / 2),
+                                width=int(px2 - px1),
+                                height=int(py2 - py1),
+                                confidence=float(p_box.conf[0]),
+                                source=DetectionSource.LICENSE_PLATE,
+                            )
+                        )
 
         return all_regions
 
@@ -602,7 +941,9 @@ class PrivacyBlurEnsemble:
                 patch = np.concatenate([left_part, right_part], axis=1)
 
             # Run detection on patch
-            results = self.face_detector(patch, conf=self.conf_threshold, verbose=False)
+            results = self.face_detector(
+                patch, conf=self.conf_threshold, half=self._use_half, verbose=False
+            )
 
             for r in results:
                 for box in r.boxes:
@@ -662,54 +1003,87 @@ class PrivacyBlurEnsemble:
         Returns:
             List of BlurRegion objects to blur
         """
+        return self.detect_batch([image])[0]
+
+    def detect_batch(
+        self,
+        images: list[np.ndarray],
+    ) -> list[list[BlurRegion]]:
+        """
+        Run all detectors on several images and return merged regions per image.
+
+        The original images are sent to the YOLO models as one batch and their
+        edge-padded versions as another. Patch detection and merging still
+        run per image.
+
+        Args:
+            images: OpenCV images (BGR format)
+
+        Returns:
+            One list of BlurRegion objects per input image, in input order
+        """
         if self.mode == "skip":
-            return []
+            return [[] for _ in images]
 
         # Full mode with models
         if not self._models_loaded:
             console.print(
                 "  [yellow]Warning: Models not loaded[/]"
             )
-            return []
+            return [[] for _ in images]
 
-        all_regions: list[BlurRegion] = []
-        height, width = image.shape[:2]
+        # 1. Detect on the originals and on their edge-padded copies in separate
+        #    calls. Mixing the two shapes in one call would make Ultralytics
+        #    letterbox every frame to a square, about twice the pixels of a
+        #    2:1 equirectangular frame.
+        original_regions = self._run_detection(images)
 
-        # 1. Run detection on original image
-        original_regions = self._run_detection(image)
-        all_regions.extend(original_regions)
-
-        # 2. Run edge-aware detection
+        padded_images: list[np.ndarray] = []
+        pad_widths: list[int] = []
         if self.edge_aware:
-            # Create edge-padded image
-            padded_image, pad_width = create_edge_padded_image(image)
-
-            # Run detection on padded image
-            padded_regions = self._run_detection(padded_image)
-
-            # Filter to only keep detections that involve the edge area
-            edge_regions = []
-            for region in padded_regions:
-                region_left = region.x - region.width // 2
-                region_right = region.x + region.width // 2
-
-                # Keep if detection overlaps with the original edge or padded area
-                if region_right > width - pad_width or region_left > width:
-                    edge_regions.append(region)
-
-            # Translate edge detections back to original coordinates
-            if edge_regions:
-                translated = translate_edge_detections(edge_regions, width, pad_width)
-                all_regions.extend(translated)
-
-        # 3. Run patch-based detection on horizon strip
-        patch_regions = self._run_patch_detection(image)
-        all_regions.extend(patch_regions)
-
-        # Merge all overlapping regions
-        merged = self._merge_overlapping(all_regions)
-
-        return merged
+            # Padded copies are written into per-ensemble buffers that are
+            # reused while frame sizes stay the same
+            for i, image in enumerate(images):
+                buffer = self._pad_buffers[i] if i < len(self._pad_buffers) else None
+                padded_image, pad_width = create_edge_padded_image(image, out=buffer)
+                if buffer is None:
+                    self._pad_buffers.append(padded_image)
+                else:
+                    self._pad_buffers[i] = padded_image
+                padded_images.append(padded_image)
+                pad_widths.append(pad_width)
+        padded_batch_regions = self._run_detection(padded_images)
+
+        results: list[list[BlurRegion]] = []
+        for i, image in enumerate(images):
+            height, width = image.shape[:2]
+            all_regions: list[BlurRegion] = list(original_regions[i])
+
+            # 2. Run edge-aware detection
+            if self.edge_aware:
+                pad_width = pad_widths[i]
+                padded_regions = padded_batch_regions[i]
+
+                # Filter to only keep detections that involve the edge area
+                edge_regions = []
+                for region in padded_regions:
+                    # Keep if detection overlaps with the original edge or padded area
+                    if region.x2 > width - pad_width or region.x1 > width:
+                        edge_regions.append(region)
+
+                # Translate edge detections back to original coordinates
+                if edge_regions:
+                    translated = translate_edge_detections(edge_regions, width, pad_width)
+                    all_regions.extend(translated)
+
+            # 3. Run patch-based detection on horizon strip
+            patch_regions = self._run_patch_detection(image)
+            all_regions.extend(patch_regions)
+
+            # Merge all overlapping regions
+            results.append(self._merge_overlapping(all_regions))
+
+        return results
 
     def _merge_overlapping(
         self, regions: list[BlurRegion], iou_threshold: float = 0.3
@@ -720,80 +1094,55 @@ class PrivacyBlurEnsemble:
         if not regions:
             return []
 
-        # Sort by area (largest first)
-        regions = sorted(regions, key=lambda r: r.width * r.height, reverse=True)
-
-        merged: list[BlurRegion] = []
-        used: set[int] = set()
-
-        for i, region in enumerate(regions):
-            if i in used:
-                continue
-
-            # Find all overlapping regions
-            cluster = [region]
-            for j, other in enumerate(regions[i + 1 :], start=i + 1):
-                if j in used:
-                    continue
-                if self._iou(region, other) > iou_threshold:
-                    cluster.append(other)
-                    used.add(j)
-
-            # Merge cluster into single region
-            merged.append(self._merge_cluster(cluster))
-            used.add(i)
-
-        return merged
-
-    def _iou(self, a: BlurRegion, b: BlurRegion) -> float:
-        """Calculate Intersection over Union between two regions."""
-        a_x1 = a.x - a.width // 2
-        a_y1 = a.y - a.height // 2
-        a_x2 = a.x + a.width // 2
-        a_y2 = a.y + a.height // 2
-
-        b_x1 = b.x - b.width // 2
-        b_y1 = b.y - b.height // 2
-        b_x2 = b.x + b.width // 2
-        b_y2 = b.y + b.height // 2
-
-        # Intersection
-        inter_x1 = max(a_x1, b_x1)
-        inter_y1 = max(a_y1, b_y1)
-        inter_x2 = min(a_x2, b_x2)
-        inter_y2 = min(a_y2, b_y2)
-
-        if inter_x2 <= inter_x1 or inter_y2 <= inter_y1:
-            return 0.0
-
-        inter_area = (inter_x2 - inter_x1) * (inter_y2 - inter_y1)
-
-        # Union
-        a_area = a.width * a.height
-        b_area = b.width * b.height
-        union_area = a_area + b_area - inter_area
-
-        return inter_area / union_area if union_area > 0 else 0.0
-
-    def _merge_cluster(self, regions: list[BlurRegion]) -> BlurRegion:
-        """Merge multiple regions into one encompassing region."""
-        min_x = min(r.x - r.width // 2 for r in regions)
-        max_x = max(r.x + r.width // 2 for r in regions)
-        min_y = min(r.y - r.height // 2 for r in regions)
-        max_y = max(r.y + r.height // 2 for r in regions)
-
-        # Check if any region spans the edge
-        spans_edge = any(r.spans_edge for r in regions)
-
-        return BlurRegion(
-            x=int((min_x + max_x) / 2),
-            y=int((min_y + max_y) / 2),
-            width=int(max_x - min_x),
-            height=int(max_y - min_y),
-            confidence=max(r.confidence for r in regions),
-            source=regions[0].source,
-            spans_edge=spans_edge,
-        )
+        columns = BlurRegionArray.from_regions(regions)
+        areas = columns.widths * columns.heights
+
+        # Sort by area (largest first); stable, so ties keep detection order
+        order = np.argsort(-areas, kind="stable")
+        columns = columns.take(order)
+
+        boxes = columns.corners()
+        labels = _cluster_boxes(boxes, areas[order], iou_threshold)
+
+        # Each label is its seed's position in the sorted order, so seeds in
+        # ascending position give the clusters in creation order
+        seeds = np.flatnonzero(labels == np.arange(len(labels)))
+        cluster_ids = np.searchsorted(seeds, labels)
+
+        # Per-cluster bounding box, max confidence and edge flag
+        mins = boxes[seeds, :2].copy()
+        maxs = boxes[seeds, 2:].copy()
+        np.minimum.at(mins, cluster_ids, boxes[:, :2])
+        np.maximum.at(maxs, cluster_ids, boxes[:, 2:])
+
+        merged = columns.take(seeds)
+        np.maximum.at(merged.confidences, cluster_ids, columns.confidences)
+        np.logical_or.at(merged.spans_edge, cluster_ids, columns.spans_edge)
+
+        # Merged region is centred on the cluster box and keeps the seed's source
+        centres = ((mins + maxs) / 2).astype(np.int64)
+        merged.xs, merged.ys = centres[:, 0], centres[:, 1]
+        merged.widths, merged.heights = (maxs - mins).T
+
+        return merged.to_list()
+
+
+@lru_cache(maxsize=4)
+def _get_detector(
+    mode: Literal["full", "skip"],
+    models_dir: Optional[Path],
+    edge_aware: bool,
+    conf_threshold: float,
+    precision: Literal["fp32", "fp16"],
+) -> PrivacyBlurEnsemble:
+    """Return a shared ensemble per configuration so models load only once."""
+    return PrivacyBlurEnsemble(
+        mode=mode,
+        models_dir=models_dir,
+        edge_aware=edge_aware,
+        conf_threshold=conf_threshold,
+        precision=precision,
+    )
 
 
 def process_blur_single(
@@ -804,6 +1153,7 @@ def process_blur_single(
     models_dir: Optional[Path] = None,
     edge_aware: bool = True,
     conf_threshold: float = 0.12,
+    precision: Literal["fp32", "fp16"] = "fp16",
 ) -> bool:
     """
     Apply privacy blur to a single image.
@@ -816,6 +1166,7 @@ def process_blur_single(
         models_dir: Directory containing YOLO models
         edge_aware: Whether to detect faces spanning equirectangular edges
         conf_threshold: Confidence threshold for detections
+        precision: Inference precision ("fp16" uses half precision on CUDA)
 
     Returns:
         True if successful, False otherwise
@@ -826,13 +1177,8 @@ def process_blur_single(
         console.print(f"  [red]Error: Could not read {input_path}[/]")
         return False
 
-    # Create detector
-    detector = PrivacyBlurEnsemble(
-        mode=mode, 
-        models_dir=models_dir, 
-        edge_aware=edge_aware,
-        conf_threshold=conf_threshold
-    )
+    # Reuse the detector (and its loaded models) across calls
+    detector = _get_detector(mode, models_dir, edge_aware, conf_threshold, precision)
 
     # Detect regions
     regions = detector.detect_all(image)
@@ -842,7 +1188,7 @@ def process_blur_single(
         console.print(f"    Found {len(regions)} regions to blur ({edge_count} edge-spanning)")
 
         # Apply blur
-        blurred = blur_image(image, regions, config)
+        blurred = blur_image(image, regions, config, inplace=True)
     else:
         console.print("    No regions detected")
         blurred = image
@@ -855,6 +1201,35 @@ def process_blur_single(
     return True
 
 
+def _process_blur_file(
+    input_file: Path,
+    output_file: Path,
+    config: BlurConfig,
+    mode: Literal["full", "skip"],
+    models_dir: Optional[Path],
+    edge_aware: bool,
+    conf_threshold: float,
+    precision: Literal["fp32", "fp16"],
+) -> Optional[tuple[int, int]]:
+    """
+    Blur a single file inside a worker process (used when no models are loaded).
+
+    Returns:
+        Tuple of (region_count, edge_region_count), or None if the image could not be read
+    """
+    image = cv2.imread(str(input_file))
+    if image is None:
+        console.print(f"  [yellow]Warning: Could not read {input_file.name}[/]")
+        return None
+
+    detector = _get_detector(mode, models_dir, edge_aware, conf_threshold, precision)
+    regions = detector.detect_all(image)
+    blurred = blur_image(image, regions, config, inplace=True)
+
+    cv2.imwrite(str(output_file), blurred)
+    return len(regions), sum(1 for r in regions if r.spans_edge)
+
+
 def process_blur_batch(
     input_dir: Path,
     output_dir: Path,
@@ -863,10 +1238,21 @@ def process_blur_batch(
     models_dir: Optional[Path] = None,
     edge_aware: bool = True,
     conf_threshold: float = 0.12,
+    precision: Literal["fp32", "fp16"] = "fp16",
+    batch_size: int = BLUR_BATCH_SIZE,
+    io_workers: int = BLUR_IO_WORKERS,
+    workers: Optional[int] = None,
 ) -> list[Path]:
     """
     Apply privacy blur to all images in a directory.
 
+    Images are processed in batches of ``batch_size``: a thread pool decodes
+    the next batch and encodes the previous one while the current batch goes
+    through detection (one YOLO call per model per batch) and blur.
+
+    When ``mode`` is not "full" there are no models to share, so files are
+    processed independently across a process pool instead.
+
     Args:
         input_dir: Directory containing input images
         output_dir: Directory to save blurred images
@@ -875,51 +1261,122 @@ def process_blur_batch(
         models_dir: Directory containing YOLO models
         edge_aware: Whether to detect faces spanning equirectangular edges
         conf_threshold: Confidence threshold for detections
+        precision: Inference precision ("fp16" uses half precision on CUDA)
+        batch_size: Number of images sent to the detectors per call
+        io_workers: Number of threads used for image reads and writes
+        workers: Number of worker processes when mode is not "full"
+            (defaults to the CPU count)
 
     Returns:
         List of output file paths
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Find all image files and their output paths once, up front (scandir
+    # yields names without building a Path per directory entry)
+    with os.scandir(input_dir) as entries:
+        names = sorted(
+            entry.name for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+        )
+    input_files = [input_dir / name for name in names]
+    target_files = {f: output_dir / f.name for f in input_files}
+
+    output_files = []
+    total_regions = 0
+    edge_regions = 0
+
+    if mode != "full":
+        # No models to share between images: fan files out across CPU cores
+        max_workers = workers or os.cpu_count() or 1
+        with worker_pool(max_workers) as pool:
+            results = pool.map(
+                _process_blur_file,
+                input_files,
+                target_files.values(),
+                repeat(config),
+                repeat(mode),
+                repeat(models_dir),
+                repeat(edge_aware),
+                repeat(conf_threshold),
+                repeat(precision),
+                chunksize=map_chunksize(len(input_files), max_workers),
+            )
+            for input_file, result in zip(input_files, results):
+                if result is None:
+                    continue
+                total_regions += result[0]
+                edge_regions += result[1]
+                output_files.append(target_files[input_file])
+
+        console.print(f"    Total: {total_regions} regions ({edge_regions} edge-spanning)")
+        return output_files
+
     # Create detector once for batch
     detector = PrivacyBlurEnsemble(
         mode=mode, 
         models_dir=models_dir, 
         edge_aware=edge_aware,
-        conf_threshold=conf_threshold
+        conf_threshold=conf_threshold,
+        precision=precision,
     )
 
-    # Find all image files
-    image_extensions = {".jpg", ".jpeg", ".png", ".tiff", ".tif"}
-    input_files = [f for f in input_dir.iterdir() if f.suffix.lower() in image_extensions]
+    batch_size = max(1, batch_size)
+    batches = [input_files[i : i + batch_size] for i in range(0, len(input_files), batch_size)]
+
+    # Images are blurred one at a time on this thread, so let OpenCV use every
+    # core for a large ROI (blur_image divides this between its blend threads
+    # when a frame has several components). The setting is process-wide, so
+    # restore it for later stages.
+    previous_cv_threads = cv2.getNumThreads()
+    cv2.setNumThreads(os.cpu_count() or 1)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, io_workers)) as pool:
+            pending_reads = [pool.submit(cv2.imread, str(f)) for f in batches[0]] if batches else []
+            pending_writes: list[Future] = []
+
+            for batch_idx, batch in enumerate(batches):
+                images = [future.result() for future in pending_reads]
+
+                # Prefetch the next batch while this one is detected and blurred
+                if batch_idx + 1 < len(batches):
+                    pending_reads = [
+                        pool.submit(cv2.imread, str(f)) for f in batches[batch_idx + 1]
+                    ]
+
+                loaded: list[tuple[Path, np.ndarray]] = []
+                for input_file, image in zip(batch, images):
+                    if image is None:
+                        console.print(
+                            f"  [yellow]Warning: Could not read {input_file.name}[/]"
+                        )
+                        continue
+                    loaded.append((input_file, image))
 
-    output_files = []
-    total_regions = 0
-    edge_regions = 0
+                # Detect regions for the whole batch
+                batch_regions = detector.detect_batch([image for _, image in loaded])
 
-    for input_file in input_files:
-        # Read image
-        image = cv2.imread(str(input_file))
-        if image is None:
-            console.print(f"  [yellow]Warning: Could not read {input_file.name}[/]")
-            continue
+                # Wait for the previous batch's writes so at most two batches are in memory
+                for future in pending_writes:
+                    future.result()
+                pending_writes = []
 
-        # Detect regions
-        regions = detector.detect_all(image)
+                for (input_file, image), regions in zip(loaded, batch_regions):
+                    total_regions += len(regions)
+                    edge_regions += sum(1 for r in regions if r.spans_edge)
 
-        total_regions += len(regions)
-        edge_regions += sum(1 for r in regions if r.spans_edge)
+                    # Apply blur (returns the input unchanged when there are no regions)
+                    blurred = blur_image(image, regions, config, inplace=True)
 
-        # Apply blur
-        if regions:
-            blurred = blur_image(image, regions, config)
-        else:
-            blurred = image
+                    # Save output
+                    output_file = target_files[input_file]
+                    pending_writes.append(pool.submit(cv2.imwrite, str(output_file), blurred))
+                    output_files.append(output_file)
 
-        # Save output
-        output_file = output_dir / input_file.name
-        cv2.imwrite(str(output_file), blurred)
-        output_files.append(output_file)
+            for future in pending_writes:
+                future.result()
+    finally:
+        cv2.setNumThreads(previous_cv_threads)
 
     console.print(f"    Total: {total_regions} regions ({edge_regions} edge-spanning)")
 
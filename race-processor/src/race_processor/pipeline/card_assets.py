@@ -3,107 +3,98 @@ Generates race card display assets from GPX data.
 """
 
 import json
+import os
+import zipfile
 from pathlib import Path
 from typing import Any
 
 import gpxpy
 import gpxpy.gpx
+import numpy as np
+from numba import njit
 
+# Column layout of the (N, 4) point arrays returned by parse_gpx
+LAT, LON, ELEVATION, DISTANCE = 0, 1, 2, 3
 
-def generate_elevation_bars(gpx_points: list[dict[str, float]], num_bars: int = 35) -> list[int]:
+# Maximum deviation (SVG px) allowed when simplifying the route overlay;
+# half the 3 px stroke width, so dropped points are not visible
+ROUTE_SIMPLIFY_EPSILON = 1.5
+
+# Most points kept in the route overlay path (the tolerance is doubled until
+# the path fits, so GPS jitter cannot grow the SVG)
+ROUTE_MAX_POINTS = 100
+
+
+def generate_elevation_bars(gpx_points: np.ndarray, num_bars: int = 35) -> list[int]:
     """
     Generate elevation bar heights (0-100) for race card display.
 
     Samples GPX at regular intervals and normalizes to 0-100 scale.
     """
-    if not gpx_points:
+    if len(gpx_points) == 0:
         return []
 
-    total_distance = gpx_points[-1].get("distance", 0)
+    total_distance = gpx_points[-1, DISTANCE]
     if total_distance == 0:
         return []
 
     step = total_distance / num_bars
 
-    sampled_elevations: list[float] = []
-    for i in range(num_bars):
-        target_dist = i * step
-        elevation = interpolate_elevation_at_distance(gpx_points, target_dist)
-        sampled_elevations.append(elevation)
+    # Interpolate all samples in one pass (distances are cumulative, so sorted)
+    sampled_elevations = np.interp(
+        np.arange(num_bars) * step, gpx_points[:, DISTANCE], gpx_points[:, ELEVATION]
+    )
 
     # Normalize to 0-100 scale
-    min_elev = min(sampled_elevations)
-    max_elev = max(sampled_elevations)
+    min_elev = sampled_elevations.min()
+    max_elev = sampled_elevations.max()
     range_elev = max_elev - min_elev or 1
 
-    return [
-        int(((e - min_elev) / range_elev) * 80 + 10)  # 10-90 range for visual balance
-        for e in sampled_elevations
-    ]
+    # 10-90 range for visual balance
+    return (((sampled_elevations - min_elev) / range_elev) * 80 + 10).astype(int).tolist()
 
 
-def interpolate_elevation_at_distance(
-    points: list[dict[str, float]], target_dist: float
-) -> float:
-    """Interpolate elevation at a given distance from a list of points."""
-    if not points:
+def interpolate_elevation_at_distance(points: np.ndarray, target_dist: float) -> float:
+    """Interpolate elevation at a given distance from an array of points."""
+    if len(points) == 0:
         return 0
 
-    for i, point in enumerate(points):
-        if point.get("distance", 0) >= target_dist:
-            if i == 0:
-                return point.get("elevation", 0)
-            prev = points[i - 1]
-            curr = point
-
-            prev_dist = prev.get("distance", 0)
-            curr_dist = curr.get("distance", 0)
-
-            if curr_dist == prev_dist:
-                return curr.get("elevation", 0)
-
-            t = (target_dist - prev_dist) / (curr_dist - prev_dist)
-            prev_elev = prev.get("elevation", 0)
-            curr_elev = curr.get("elevation", 0)
-            return prev_elev + (curr_elev - prev_elev) * t
-
-    return points[-1].get("elevation", 0)
+    return float(np.interp(target_dist, points[:, DISTANCE], points[:, ELEVATION]))
 
 
 def generate_route_overlay_svg(
-    gpx_points: list[dict[str, float]], width: int = 400, height: int = 200
+    gpx_points: np.ndarray, width: int = 400, height: int = 200
 ) -> str:
     """Generate simplified route SVG for card image overlay."""
-    if not gpx_points:
+    if len(gpx_points) == 0:
         return ""
 
     # Get bounds
-    lats = [p["lat"] for p in gpx_points]
-    lons = [p["lon"] for p in gpx_points]
+    lats = gpx_points[:, LAT]
+    lons = gpx_points[:, LON]
 
-    min_lat, max_lat = min(lats), max(lats)
-    min_lon, max_lon = min(lons), max(lons)
+    min_lat, max_lat = lats.min(), lats.max()
+    min_lon, max_lon = lons.min(), lons.max()
 
     lat_range = max_lat - min_lat or 0.001
     lon_range = max_lon - min_lon or 0.001
 
     padding = 20
 
-    def project(lat: float, lon: float) -> tuple[float, float]:
-        x = padding + ((lon - min_lon) / lon_range) * (width - 2 * padding)
-        y = height - padding - ((lat - min_lat) / lat_range) * (height - 2 * padding)
-        return x, y
-
-    # Simplify to ~50-100 points
-    step = max(1, len(gpx_points) // 100)
-    simplified = gpx_points[::step]
+    # Project all points at once
+    xs = padding + ((lons - min_lon) / lon_range) * (width - 2 * padding)
+    ys = height - padding - ((lats - min_lat) / lat_range) * (height - 2 * padding)
 
-    coords = [project(p["lat"], p["lon"]) for p in simplified]
+    # Simplify in pixel space: keep turns, drop points on straight stretches
+    epsilon = ROUTE_SIMPLIFY_EPSILON
+    keep = _rdp_keep_mask(xs, ys, epsilon)
+    while np.count_nonzero(keep) > ROUTE_MAX_POINTS:
+        epsilon *= 2
+        keep = _rdp_keep_mask(xs, ys, epsilon)
+    xs, ys = xs[keep], ys[keep]
 
     # Generate path
-    path_d = f"M {coords[0][0]:.1f} {coords[0][1]:.1f}"
-    for x, y in coords[1:]:
-        path_d += f" L {x:.1f} {y:.1f}"
+    path_d = "M " + " L ".join(f"{x:.1f} {y:.1f}" for x, y in zip(xs.tolist(), ys.tolist()))
 
     svg = f'''<svg viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">
   <defs>
@@ -127,12 +118,76 @@ def generate_route_overlay_svg(
     return svg
 
 
-def parse_gpx(gpx_path: Path) -> list[dict[str, float]]:
-    """Parse GPX file into list of points with distance."""
+@njit(cache=True)
+def _rdp_keep_mask(xs: np.ndarray, ys: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Ramer-Douglas-Peucker simplification (compiled with Numba).
+
+    Uses an explicit stack instead of recursion, so long tracks cannot hit
+    a recursion limit.
+
+    Args:
+        xs: (N,) point x coordinates
+        ys: (N,) point y coordinates
+        epsilon: Maximum allowed distance of a dropped point from the line
+
+    Returns:
+        (N,) bool mask of points to keep; first and last are always kept
+    """
+    n = len(xs)
+    keep = np.zeros(n, dtype=np.bool_)
+    if n == 0:
+        return keep
+    keep[0] = True
+    keep[n - 1] = True
+
+    stack = np.empty((n, 2), dtype=np.int64)
+    stack[0, 0], stack[0, 1] = 0, n - 1
+    top = 1
+
+    while top > 0:
+        top -= 1
+        start, end = stack[top, 0], stack[top, 1]
+        if end - start < 2:
+            continue
+
+        dx = xs[end] - xs[start]
+        dy = ys[end] - ys[start]
+        length = np.sqrt(dx * dx + dy * dy)
+
+        # Point farthest from the start-end chord
+        max_dist = -1.0
+        max_idx = start
+        for i in range(start + 1, end):
+            px = xs[i] - xs[start]
+            py = ys[i] - ys[start]
+            if length == 0:
+                dist = np.sqrt(px * px + py * py)
+            else:
+                dist = abs(dy * px - dx * py) / length
+            if dist > max_dist:
+                max_dist = dist
+                max_idx = i
+
+        if max_dist > epsilon:
+            keep[max_idx] = True
+            stack[top, 0], stack[top, 1] = start, max_idx
+            stack[top + 1, 0], stack[top + 1, 1] = max_idx, end
+            top += 2
+
+    return keep
+
+
+def parse_gpx(gpx_path: Path) -> np.ndarray:
+    """
+    Parse GPX file into an (N, 4) float64 array of points with distance.
+
+    Columns are LAT, LON, ELEVATION and cumulative DISTANCE (meters).
+    """
     with open(gpx_path) as f:
         gpx = gpxpy.parse(f)
 
-    points: list[dict[str, float]] = []
+    rows: list[tuple[float, float, float, float]] = []
     cumulative_distance = 0.0
     prev_point = None
 
@@ -142,20 +197,53 @@ def parse_gpx(gpx_path: Path) -> list[dict[str, float]]:
                 if prev_point:
                     cumulative_distance += point.distance_3d(prev_point) or 0
 
-                points.append({
-                    "lat": point.latitude,
-                    "lon": point.longitude,
-                    "elevation": point.elevation or 0,
-                    "distance": cumulative_distance,
-                })
+                rows.append(
+                    (point.latitude, point.longitude, point.elevation or 0, cumulative_distance)
+                )
                 prev_point = point
 
+    return np.array(rows, dtype=np.float64).reshape(-1, 4)
+
+
+def _parse_gpx_cached(gpx_path: Path) -> np.ndarray:
+    """
+    Parse a GPX file, reusing a ``.gpx.npz`` cache stored next to it.
+
+    The cache records the source file's mtime and size and is only used
+    while both still match; otherwise the GPX is parsed and the cache
+    rewritten. A cache that cannot be read is treated as a miss, and caching
+    is skipped if the directory is not writable.
+    """
+    cache_path = gpx_path.with_suffix(gpx_path.suffix + ".npz")
+    stat = gpx_path.stat()
+    key = np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+    if cache_path.exists():
+        try:
+            with np.load(cache_path) as cache:
+                if np.array_equal(cache["key"], key):
+                    return cache["points"]
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            pass  # Damaged, truncated or stale layout: parse again below
+
+    points = parse_gpx(gpx_path)
+
+    # Write under a temporary name so an interrupted run never leaves a
+    # partial cache behind
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez(f, key=key, points=points)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
     return points
 
 
 def generate_all_card_assets(gpx_path: Path, output_dir: Path, race_slug: str) -> None:
     """Generate all card assets from GPX data."""
-    points = parse_gpx(gpx_path)
+    points = _parse_gpx_cached(gpx_path)
 
     # Elevation bars
     bars = generate_elevation_bars(points)
@@ -167,10 +255,11 @@ def generate_all_card_assets(gpx_path: Path, output_dir: Path, race_slug: str) -
     with open(output_dir / "route-overlay.svg", "w") as f:
         f.write(svg)
 
-    # Elevation profile points
+    # Elevation profile points (dicts are only built for the sampled rows)
+    sampled = points[:: max(1, len(points) // 200), [DISTANCE, ELEVATION]].tolist()
     profile_points = [
-        {"distance_meters": int(p["distance"]), "elevation_meters": round(p["elevation"], 2)}
-        for p in points[:: max(1, len(points) // 200)]
+        {"distance_meters": int(distance), "elevation_meters": round(elevation, 2)}
+        for distance, elevation in sampled
     ]
     with open(output_dir / "elevation-profile.json", "w") as f:
         json.dump(profile_points, f)
@@ -9,22 +9,38 @@ This step takes a folder of equirectangular JPGs exported from Insta360 Studio a
 """
 
 import json
+import math
+import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
-import exifread
+from PIL import ExifTags, Image
 from rich.console import Console
 from rich.table import Table
 
+from race_processor.config import IMAGE_EXTENSIONS
 from race_processor.utils.geo import calculate_image_headings
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 console = Console()
 
+# Threads used to read EXIF headers concurrently during intake
+EXIF_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-@dataclass
+# Linux ioctl that clones file extents (reflink) on copy-on-write filesystems
+FICLONE = 0x40049409
+
+
+@dataclass(slots=True)
 class ImageMetadata:
     """Metadata extracted from a single image.
 
@@ -68,22 +84,51 @@ class IntakeManifest:
             "images": [asdict(img) for img in self.images],
         }
 
+    def write_json(self, f: TextIO) -> None:
+        """
+        Write the manifest as indented JSON, one image at a time.
+
+        Produces the same text as json.dump(self.to_dict(), f, indent=2,
+        ensure_ascii=False) without building the dict list for every image.
+        """
+        f.write("{\n")
+        for key in ("race_slug", "created_at", "total_images"):
+            f.write(f'  "{key}": {json.dumps(getattr(self, key), ensure_ascii=False)},\n')
+        f.write('  "images": [')
+        separator = "\n    "
+        for img in self.images:
+            item = json.dumps(asdict(img), indent=2, ensure_ascii=False)
+            f.write(separator + item.replace("\n", "\n    "))
+            separator = ",\n    "
+        f.write("\n  ]\n}" if self.images else "]\n}")
+
+
+def _rational_to_float(value) -> Optional[float]:
+    """Convert a Pillow EXIF rational to a finite float."""
+    try:
+        result = float(value)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    return result if math.isfinite(result) else None
+
 
 def _convert_to_degrees(value) -> Optional[float]:
     """Convert EXIF GPS coordinate to decimal degrees."""
     try:
-        d = float(value.values[0].num) / float(value.values[0].den)
-        m = float(value.values[1].num) / float(value.values[1].den)
-        s = float(value.values[2].num) / float(value.values[2].den)
-        return d + (m / 60.0) + (s / 3600.0)
-    except (AttributeError, IndexError, ZeroDivisionError):
+        d, m, s = (_rational_to_float(part) for part in value[:3])
+    except (TypeError, ValueError):
+        return None
+    if d is None or m is None or s is None:
         return None
+    return d + (m / 60.0) + (s / 3600.0)
 
 
 def _extract_exif(image_path: Path) -> dict:
     """
     Extract relevant EXIF data from an image.
 
+    Only the EXIF header is parsed; Pillow does not decode pixel data here.
+
     Returns dict with keys: captured_at, latitude, longitude, altitude_meters
     Note: heading is NOT extracted - will be calculated from GPX correlation.
     """
@@ -95,50 +140,52 @@ def _extract_exif(image_path: Path) -> dict:
     }
 
     try:
-        with open(image_path, "rb") as f:
-            tags = exifread.process_file(f, details=False)
+        with Image.open(image_path) as img:
+            exif = img.getexif()
+            exif_ifd = exif.get_ifd(ExifTags.IFD.Exif)
+            gps = exif.get_ifd(ExifTags.IFD.GPSInfo)
 
         # Extract capture timestamp
-        date_tag = tags.get("EXIF DateTimeOriginal") or tags.get("Image DateTime")
+        date_tag = exif_ifd.get(ExifTags.Base.DateTimeOriginal) or exif.get(
+            ExifTags.Base.DateTime
+        )
         if date_tag:
             try:
-                dt = datetime.strptime(str(date_tag), "%Y:%m:%d %H:%M:%S")
+                dt = datetime.strptime(str(date_tag).strip("\x00 "), "%Y:%m:%d %H:%M:%S")
                 result["captured_at"] = dt.isoformat()
             except ValueError:
                 pass
 
         # Extract GPS latitude
-        lat = tags.get("GPS GPSLatitude")
-        lat_ref = tags.get("GPS GPSLatitudeRef")
+        lat = gps.get(ExifTags.GPS.GPSLatitude)
+        lat_ref = gps.get(ExifTags.GPS.GPSLatitudeRef)
         if lat and lat_ref:
             lat_deg = _convert_to_degrees(lat)
             if lat_deg is not None:
-                if str(lat_ref) == "S":
+                if str(lat_ref).startswith("S"):
                     lat_deg = -lat_deg
                 result["latitude"] = round(lat_deg, 8)
 
         # Extract GPS longitude
-        lon = tags.get("GPS GPSLongitude")
-        lon_ref = tags.get("GPS GPSLongitudeRef")
+        lon = gps.get(ExifTags.GPS.GPSLongitude)
+        lon_ref = gps.get(ExifTags.GPS.GPSLongitudeRef)
         if lon and lon_ref:
             lon_deg = _convert_to_degrees(lon)
             if lon_deg is not None:
-                if str(lon_ref) == "W":
+                if str(lon_ref).startswith("W"):
                     lon_deg = -lon_deg
                 result["longitude"] = round(lon_deg, 8)
 
         # Extract altitude
-        alt = tags.get("GPS GPSAltitude")
-        alt_ref = tags.get("GPS GPSAltitudeRef")
-        if alt:
-            try:
-                alt_val = float(alt.values[0].num) / float(alt.values[0].den)
+        alt = gps.get(ExifTags.GPS.GPSAltitude)
+        alt_ref = gps.get(ExifTags.GPS.GPSAltitudeRef)
+        if alt is not None:
+            alt_val = _rational_to_float(alt)
+            if alt_val is not None:
                 # GPSAltitudeRef: 0 = above sea level, 1 = below sea level
-                if alt_ref and str(alt_ref) == "1":
+                if alt_ref in (1, b"\x01"):
                     alt_val = -alt_val
                 result["altitude_meters"] = round(alt_val, 2)
-            except (AttributeError, IndexError, ZeroDivisionError):
-                pass
 
     except Exception as e:
         console.print(f"  [yellow]Warning: Could not read EXIF from {image_path.name}: {e}[/]")
@@ -146,6 +193,27 @@ def _extract_exif(image_path: Path) -> dict:
     return result
 
 
+def _copy_image(src_path: Path, dst_path: Path) -> None:
+    """
+    Copy a source image into the intake directory.
+
+    On Btrfs/XFS the copy is a reflink, so no bytes are duplicated until one
+    side is modified. Otherwise falls back to shutil.copy2, which already uses
+    copy_file_range/sendfile on Linux. Hard links are deliberately not used:
+    they would alias the user's originals with pipeline files.
+    """
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            pass  # Not a CoW filesystem, or source and output on different devices
+        else:
+            shutil.copystat(src_path, dst_path)
+            return
+    shutil.copy2(src_path, dst_path)
+
+
 def run_intake(
     input_dir: Path,
     output_dir: Path,
@@ -167,11 +235,11 @@ def run_intake(
     console.print(f"  Scanning {input_dir} for images...")
 
     # Find all image files
-    extensions = {".jpg", ".jpeg", ".png", ".tiff", ".tif"}
-    source_files = [
-        f for f in input_dir.iterdir()
-        if f.is_file() and f.suffix.lower() in extensions
-    ]
+    with os.scandir(input_dir) as entries:
+        source_files = [
+            input_dir / entry.name for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+        ]
 
     if not source_files:
         console.print(f"  [red]No image files found in {input_dir}[/]")
@@ -181,11 +249,11 @@ def run_intake(
 
     # Extract EXIF from all images
     console.print("  Extracting EXIF metadata...")
-    images_with_exif: list[tuple[Path, dict]] = []
-
-    for img_path in source_files:
-        exif_data = _extract_exif(img_path)
-        images_with_exif.append((img_path, exif_data))
+    # Reading EXIF is dominated by small file reads, so overlap them on threads
+    with ThreadPoolExecutor(max_workers=EXIF_READ_WORKERS) as pool:
+        images_with_exif: list[tuple[Path, dict]] = list(
+            zip(source_files, pool.map(_extract_exif, source_files))
+        )
 
     # Sort by capture timestamp (fall back to filename if no timestamp)
     def sort_key(item: tuple[Path, dict]) -> tuple:
@@ -235,7 +303,7 @@ def run_intake(
         dst_path = output_dir / new_name
 
         # Copy file
-        shutil.copy2(src_path, dst_path)
+        _copy_image(src_path, dst_path)
 
         # Build metadata entry
         meta = ImageMetadata(
@@ -272,7 +340,7 @@ def run_intake(
     # Save metadata.json
     metadata_path = output_dir / "metadata.json"
     with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(manifest.to_dict(), f, indent=2, ensure_ascii=False)
+        manifest.write_json(f)
 
     console.print(f"  [green]Saved metadata.json with {len(image_metadata)} entries[/]")
 
@@ -284,10 +352,12 @@ def run_intake(
 
 def _print_summary(images: list[ImageMetadata]) -> None:
     """Print a summary table of extracted metadata."""
-    # Count images with GPS data
-    with_gps = sum(1 for img in images if img.latitude is not None)
-    with_altitude = sum(1 for img in images if img.altitude_meters is not None)
-    with_heading = sum(1 for img in images if img.heading_degrees is not None)
+    # Count images with GPS data in a single pass
+    with_gps = with_altitude = with_heading = 0
+    for img in images:
+        with_gps += img.latitude is not None
+        with_altitude += img.altitude_meters is not None
+        with_heading += img.heading_degrees is not None
 
     table = Table(title="EXIF Extraction Summary")
     table.add_column("Metric", style="cyan")
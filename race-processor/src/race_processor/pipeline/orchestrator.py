@@ -13,8 +13,12 @@ Debug mode saves intermediate images after each step for inspection.
 Direct mode (--src/--dst) allows testing individual steps on arbitrary images.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import IntEnum
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import Literal, Optional
 import shutil
@@ -31,12 +35,14 @@ from ..config import (
     ImageTiersConfig,
     R2Config,
     DEFAULT_MODELS_DIR,
+    IMAGE_EXTENSIONS,
 )
 from .intake import run_intake, load_manifest, IntakeManifest
 from .watermark import add_copyright_watermark, process_single_image as watermark_single
 from .export import run_export
 from .upload import run_upload, run_privacy_check
 from ..utils.gpx_override import override_gps_from_gpx, save_manifest
+from ..utils.parallel import map_chunksize, worker_pool
 from ..detection.ensemble import (
     PrivacyBlurEnsemble,
     blur_image,
@@ -68,6 +74,13 @@ STEP_NAMES = {
 }
 
 
+# Threads per process that encode and write images while the next one is computed
+IMAGE_WRITE_WORKERS = 4
+
+# File suffixes that name the same debug output format
+DEBUG_FORMAT_ALIASES = {"jpeg": "jpg", "tif": "tiff"}
+
+
 def should_run_step(step: PipelineStep, config: PipelineConfig) -> bool:
     """Check if a step should run based on step control configuration."""
     return config.step_control.start_step <= step <= config.step_control.end_step
@@ -106,6 +119,15 @@ def save_debug_image(
     output_ext = f".{debug_config.output_format}"
     output_path = debug_dir / f"{image_name}{output_ext}"
 
+    # Already in the requested format: copy the bytes instead of decoding
+    # and re-encoding the image
+    source_format = image_path.suffix.lower().lstrip(".")
+    source_format = DEBUG_FORMAT_ALIASES.get(source_format, source_format)
+    if source_format == debug_config.output_format and image_path.exists():
+        shutil.copyfile(image_path, output_path)
+        console.print(f"    [dim]Debug: saved {output_path.name}[/]")
+        return output_path
+
     # Read and save with configured format/quality
     image = cv2.imread(str(image_path))
     if image is not None:
@@ -223,8 +245,155 @@ def print_step_summary(config: PipelineConfig, blur_mode: str = "full") -> None:
 
 def get_image_files(directory: Path) -> list[Path]:
     """Get all image files from a directory."""
-    extensions = {".jpg", ".jpeg", ".png", ".tiff", ".tif"}
-    return sorted([f for f in directory.iterdir() if f.suffix.lower() in extensions])
+    with os.scandir(directory) as entries:
+        names = sorted(
+            entry.name for entry in entries
+            if entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file()
+        )
+    return [directory / name for name in names]
+
+
+def _first_image_dir(*directories: Path) -> tuple[Path, list[Path]]:
+    """
+    Pick the first directory that contains images.
+
+    Returns:
+        The chosen directory and its image files (the last directory and an
+        empty list if none contain images)
+    """
+    for directory in directories:
+        images = get_image_files(directory)
+        if images:
+            return directory, images
+    return directories[-1], []
+
+
+def resize_to_tiers(
+    image: "cv2.typing.MatLike", tier_widths: dict[str, int]
+) -> dict[str, "cv2.typing.MatLike"]:
+    """
+    Resize an image to every quality tier, keeping its aspect ratio.
+
+    Only the largest tier is resampled (Lanczos) from the source; each
+    smaller tier is area-averaged from the next larger one, so the big
+    equirectangular frame is filtered once instead of once per tier.
+
+    Args:
+        image: Source image (BGR)
+        tier_widths: Target width for each tier name
+
+    Returns:
+        Resized image for each tier name, in the order of tier_widths
+    """
+    height, width = image.shape[:2]
+
+    resized: dict[str, "cv2.typing.MatLike"] = {}
+    previous = None
+    for tier_name in sorted(tier_widths, key=tier_widths.get, reverse=True):
+        # Calculate new dimensions maintaining aspect ratio
+        new_width = tier_widths[tier_name]
+        new_height = int(height * (new_width / width))
+
+        if previous is None:
+            previous = cv2.resize(
+                image, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4
+            )
+        else:
+            previous = cv2.resize(
+                previous, (new_width, new_height), interpolation=cv2.INTER_AREA
+            )
+        resized[tier_name] = previous
+
+    return {tier_name: resized[tier_name] for tier_name in tier_widths}
+
+
+@lru_cache(maxsize=None)
+def _image_writer(pid: int) -> ThreadPoolExecutor:
+    """
+    Get this process's image writer threads.
+
+    Keyed by process id so a forked worker never reuses threads that only
+    existed in its parent. cv2.imwrite releases the GIL, so encodes submitted
+    here overlap with resizing in the calling thread.
+    """
+    return ThreadPoolExecutor(max_workers=IMAGE_WRITE_WORKERS)
+
+
+def _resize_to_tiers(img_path: Path, resized_dir: Path, tier_widths: dict[str, int]) -> bool:
+    """
+    Resize one image to every quality tier (runs in a worker process).
+
+    Args:
+        img_path: Source image
+        resized_dir: Directory containing one subdirectory per tier
+        tier_widths: Target width for each tier name
+
+    Returns:
+        True if the image was read and all tiers were written
+    """
+    image = cv2.imread(str(img_path))
+    if image is None:
+        return False
+
+    # Build output paths as strings for OpenCV without a Path per tier
+    base, name = os.fspath(resized_dir), img_path.name
+    writer = _image_writer(os.getpid())
+    pending = [
+        writer.submit(cv2.imwrite, os.path.join(base, tier_name, name), resized)
+        for tier_name, resized in resize_to_tiers(image, tier_widths).items()
+    ]
+    for future in pending:
+        future.result()
+
+    return True
+
+
+def _watermark_image(
+    img_path: Path,
+    output_path: Path,
+    copyright_config: CopyrightConfig,
+    year: int,
+    resized_dir: Optional[Path],
+    tier_widths: dict[str, int],
+) -> bool:
+    """
+    Watermark one image, optionally resizing it to every tier in the same pass.
+
+    Runs in a worker process. Resizing from the in-memory watermarked image
+    avoids decoding the watermarked file again in the resize stage.
+
+    Args:
+        img_path: Source image
+        output_path: Path to save the watermarked image
+        copyright_config: Copyright configuration
+        year: Year to use in copyright text
+        resized_dir: Directory with one subdirectory per tier, or None to skip resizing
+        tier_widths: Target width for each tier name
+
+    Returns:
+        True if the image was read and all outputs were written
+    """
+    image = cv2.imread(str(img_path))
+    if image is None:
+        return False
+
+    watermarked = add_copyright_watermark(image, copyright_config, year)
+
+    # Encode the watermarked image while the tiers are being resized
+    writer = _image_writer(os.getpid())
+    pending = [writer.submit(cv2.imwrite, str(output_path), watermarked)]
+
+    if resized_dir is not None:
+        base, name = os.fspath(resized_dir), img_path.name
+        for tier_name, resized in resize_to_tiers(watermarked, tier_widths).items():
+            pending.append(
+                writer.submit(cv2.imwrite, os.path.join(base, tier_name, name), resized)
+            )
+
+    for future in pending:
+        future.result()
+
+    return True
 
 
 def run_direct_processing(
@@ -234,12 +403,15 @@ def run_direct_processing(
     end_step: int,
     blur_mode: str = "full",
     blur_conf: float = 0.12,
+    blur_precision: Literal["fp32", "fp16"] = "fp16",
     debug: bool = False,
     debug_format: str = "jpg",
     single_image: Optional[str] = None,
     copyright_text: Optional[str] = None,
     r2_config: Optional[R2Config] = None,
     upload_prefix: Optional[str] = None,
+    force: bool = False,
+    workers: Optional[int] = None,
 ) -> None:
     """
     Run direct processing on arbitrary images without the full pipeline structure.
@@ -254,12 +426,16 @@ def run_direct_processing(
         end_step: Ending step number (1-6)
         blur_mode: Blur detection mode ("full", "skip")
         blur_conf: Confidence threshold for blur detection
+        blur_precision: Detector inference precision ("fp32" or "fp16")
         debug: Enable debug output
         debug_format: Format for debug images
         single_image: Process only this specific filename
         copyright_text: Custom copyright text
         r2_config: Optional R2 configuration for upload step
         upload_prefix: Optional override for R2 storage prefix
+        force: Re-encode exports even if outputs are up to date
+        workers: Number of worker processes for skip-mode blur and export
+            (defaults to the CPU count)
     """
     # Ensure destination exists
     dst.mkdir(parents=True, exist_ok=True)
@@ -311,22 +487,47 @@ def run_direct_processing(
             blur_config = BlurConfig()
 
             processed = 0
-            for name, path in current_files.items():
-                output_path = step_output / name
-                success = process_blur_single(
-                    path,
-                    output_path,
+            source_dirs = {path.parent for path in current_files.values()}
+            batch_dir = source_dirs.pop() if len(source_dirs) == 1 else None
+            if batch_dir is not None and {
+                f.name for f in get_image_files(batch_dir)
+            } == current_files.keys():
+                # The whole directory is being processed: use the batched
+                # path so detection runs on several images per model call
+                output_files = process_blur_batch(
+                    batch_dir,
+                    step_output,
                     blur_config,
                     mode=blur_mode,
                     models_dir=DEFAULT_MODELS_DIR,
                     conf_threshold=blur_conf,
+                    precision=blur_precision,
+                    workers=workers,
                 )
-                if success:
-                    current_files[name] = output_path
+                for output_path in output_files:
+                    current_files[output_path.name] = output_path
                     processed += 1
 
                     if debug:
                         save_debug_image(output_path, step, dst, debug_config)
+            else:
+                for name, path in current_files.items():
+                    output_path = step_output / name
+                    success = process_blur_single(
+                        path,
+                        output_path,
+                        blur_config,
+                        mode=blur_mode,
+                        models_dir=DEFAULT_MODELS_DIR,
+                        conf_threshold=blur_conf,
+                        precision=blur_precision,
+                    )
+                    if success:
+                        current_files[name] = output_path
+                        processed += 1
+
+                        if debug:
+                            save_debug_image(output_path, step, dst, debug_config)
 
             console.print(f"  [green]Processed {processed} images[/]")
 
@@ -358,35 +559,34 @@ def run_direct_processing(
             for tier in ["thumbnail", "medium", "full"]:
                 (step_output / tier).mkdir(exist_ok=True)
 
-            tiers = {
-                "thumbnail": tier_config.thumbnail,
-                "medium": tier_config.medium,
-                "full": tier_config.full,
+            tier_widths = {
+                "thumbnail": tier_config.thumbnail.width,
+                "medium": tier_config.medium.width,
+                "full": tier_config.full.width,
             }
 
+            # Output directories as strings, joined per image for OpenCV
+            tier_dirs = {tier_name: str(step_output / tier_name) for tier_name in tier_widths}
+            writer = _image_writer(os.getpid())
+
             processed = 0
             for name, path in current_files.items():
                 image = cv2.imread(str(path))
                 if image is None:
                     continue
 
-                height, width = image.shape[:2]
-
-                for tier_name, tier in tiers.items():
-                    new_width = tier.width
-                    new_height = int(height * (new_width / width))
-
-                    resized = cv2.resize(
-                        image, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4
-                    )
-
-                    tier_output = step_output / tier_name / name
-                    cv2.imwrite(str(tier_output), resized)
+                pending = []
+                for tier_name, resized in resize_to_tiers(image, tier_widths).items():
+                    tier_output = os.path.join(tier_dirs[tier_name], name)
+                    pending.append(writer.submit(cv2.imwrite, tier_output, resized))
 
                     if debug:
                         debug_name = f"{Path(name).stem}_{tier_name}"
                         save_debug_image_from_array(resized, step, dst, debug_config, debug_name)
 
+                for future in pending:
+                    future.result()
+
                 # Update current_files to point to full resolution
                 current_files[name] = step_output / "full" / name
                 processed += 1
@@ -402,7 +602,13 @@ def run_direct_processing(
             # For export, we need the quality tiers from resize
             console.print(f"  Exporting to WebP...")
             # We need to structure the output base for export
-            run_export(step_output.parent, step_output.parent, ImageTiersConfig())
+            run_export(
+                step_output.parent,
+                step_output.parent,
+                ImageTiersConfig(),
+                workers=workers,
+                force=force,
+            )
             
             # Step output now contains final/ with tiers
             console.print(f"  [green]Export complete[/]")
@@ -435,7 +641,8 @@ def run_direct_processing(
     for d in sorted(output_dirs):
         if d.name == "debug":
             continue
-        file_count = len(list(d.rglob("*")) if d.is_dir() else [])
+        # Count names from os.walk rather than building a Path per entry
+        file_count = sum(len(files) for _, _, files in os.walk(d))
         console.print(f"    - {d.name}/: {file_count} files")
 
 
@@ -443,6 +650,7 @@ def run_pipeline(
     config: PipelineConfig,
     blur_mode: Literal["full", "skip"] = "full",
     blur_conf: float = 0.12,
+    blur_precision: Literal["fp32", "fp16"] = "fp16",
 ) -> None:
     """
     Run the processing pipeline with step control and debug output.
@@ -569,6 +777,7 @@ def run_pipeline(
                 mode=blur_mode,
                 models_dir=DEFAULT_MODELS_DIR,
                 conf_threshold=blur_conf,
+                precision=blur_precision,
             )
             console.print(f"  [green]Blurred {len(output_files)} images[/]")
 
@@ -583,6 +792,19 @@ def run_pipeline(
     else:
         console.print("\n[dim]Stage 2: Blur - Skipped (step control)[/]")
 
+    tier_widths = {
+        "thumbnail": config.image_tiers.thumbnail.width,
+        "medium": config.image_tiers.medium.width,
+        "full": config.image_tiers.full.width,
+    }
+
+    # When both steps run, the watermark workers also write the resize tiers
+    # from the image they already hold, saving a decode per image
+    fuse_resize = should_run_step(PipelineStep.WATERMARK, config) and should_run_step(
+        PipelineStep.RESIZE, config
+    )
+    fused_images: list[Path] = []
+
     # =========================================================================
     # Stage 3: Watermark
     # =========================================================================
@@ -590,34 +812,46 @@ def run_pipeline(
         console.print("\n[bold]Stage 3: Watermark[/]")
 
         # Get source images from blurred directory (or intake if blur was skipped)
-        source_dir = dirs["blurred"] if get_image_files(dirs["blurred"]) else dirs["intake"]
-        source_images = get_image_files(source_dir)
+        source_dir, source_images = _first_image_dir(dirs["blurred"], dirs["intake"])
 
         if source_images:
             year = datetime.now().year
             console.print(f"  Processing {len(source_images)} images...")
             console.print(f"  Copyright text: {config.copyright.text.format(year=year)}")
 
+            if fuse_resize:
+                for tier_name in tier_widths:
+                    (dirs["resized"] / tier_name).mkdir(exist_ok=True)
+
+            # Each image is independent, so spread them across processes
+            output_paths = [dirs["watermarked"] / img_path.name for img_path in source_images]
+            with worker_pool(config.workers) as pool:
+                results = list(pool.map(
+                    _watermark_image,
+                    source_images,
+                    output_paths,
+                    repeat(config.copyright),
+                    repeat(year),
+                    repeat(dirs["resized"] if fuse_resize else None),
+                    repeat(tier_widths),
+                    chunksize=map_chunksize(len(source_images), config.workers),
+                ))
+
             processed_count = 0
-            for img_path in source_images:
-                output_path = dirs["watermarked"] / img_path.name
-                success = watermark_single(
-                    img_path, output_path, config.copyright
-                )
-                if success:
-                    processed_count += 1
-
-                    # Save debug output
-                    if config.debug.enabled:
-                        image = cv2.imread(str(output_path))
-                        if image is not None:
-                            save_debug_image_from_array(
-                                image,
-                                PipelineStep.WATERMARK,
-                                output_base,
-                                config.debug,
-                                img_path.stem,
-                            )
+            for img_path, output_path, success in zip(source_images, output_paths, results):
+                if not success:
+                    console.print(f"  [red]Error: Could not read {img_path}[/]")
+                    continue
+
+                processed_count += 1
+                if fuse_resize:
+                    fused_images.append(output_path)
+
+                # Save debug output
+                if config.debug.enabled:
+                    save_debug_image(
+                        output_path, PipelineStep.WATERMARK, output_base, config.debug
+                    )
 
             console.print(f"  [green]Watermarked {processed_count} images[/]")
         else:
@@ -632,56 +866,47 @@ def run_pipeline(
     if should_run_step(PipelineStep.RESIZE, config):
         console.print("\n[bold]Stage 4: Resize[/]")
 
-        # Get source images from watermarked directory
-        source_dir = dirs["watermarked"]
-        if not get_image_files(source_dir):
-            source_dir = dirs["blurred"]
-        if not get_image_files(source_dir):
-            source_dir = dirs["intake"]
+        if fused_images:
+            # Tiers were already written by the watermark workers
+            source_images = fused_images
+            console.print(f"  {len(source_images)} images resized during watermarking")
+        else:
+            # Get source images from watermarked directory
+            _, source_images = _first_image_dir(
+                dirs["watermarked"], dirs["blurred"], dirs["intake"]
+            )
 
-        source_images = get_image_files(source_dir)
+            if source_images:
+                console.print(f"  Processing {len(source_images)} images...")
+
+                # Create tier directories
+                for tier_name in tier_widths:
+                    (dirs["resized"] / tier_name).mkdir(exist_ok=True)
+
+                # Each image is independent, so spread them across processes
+                with worker_pool(config.workers) as pool:
+                    results = list(pool.map(
+                        _resize_to_tiers,
+                        source_images,
+                        repeat(dirs["resized"]),
+                        repeat(tier_widths),
+                        chunksize=map_chunksize(len(source_images), config.workers),
+                    ))
+                source_images = [
+                    img_path for img_path, success in zip(source_images, results) if success
+                ]
 
         if source_images:
-            console.print(f"  Processing {len(source_images)} images...")
-
-            # Create tier directories
-            for tier_name in ["thumbnail", "medium", "full"]:
-                (dirs["resized"] / tier_name).mkdir(exist_ok=True)
-
-            tier_configs = {
-                "thumbnail": config.image_tiers.thumbnail,
-                "medium": config.image_tiers.medium,
-                "full": config.image_tiers.full,
-            }
-
-            for img_path in source_images:
-                image = cv2.imread(str(img_path))
-                if image is None:
-                    continue
-
-                height, width = image.shape[:2]
-
-                for tier_name, tier_config in tier_configs.items():
-                    # Calculate new dimensions maintaining aspect ratio
-                    new_width = tier_config.width
-                    new_height = int(height * (new_width / width))
-
-                    resized = cv2.resize(
-                        image, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4
-                    )
-
-                    output_path = dirs["resized"] / tier_name / img_path.name
-                    cv2.imwrite(str(output_path), resized)
-
-                    # Debug output for each tier
-                    if config.debug.enabled:
-                        debug_name = f"{img_path.stem}_{tier_name}"
-                        save_debug_image_from_array(
-                            resized,
+            # Debug output for each tier, written from the main process
+            if config.debug.enabled:
+                for img_path in source_images:
+                    for tier_name in tier_widths:
+                        save_debug_image(
+                            dirs["resized"] / tier_name / img_path.name,
                             PipelineStep.RESIZE,
                             output_base,
                             config.debug,
-                            debug_name,
+                            f"{img_path.stem}_{tier_name}",
                         )
 
             console.print(
@@ -708,7 +933,13 @@ def run_pipeline(
         )
 
         if has_resized:
-            run_export(output_base, output_base, config.image_tiers)
+            run_export(
+                output_base,
+                output_base,
+                config.image_tiers,
+                workers=config.workers,
+                force=config.force,
+            )
         else:
             console.print("  [yellow]No resized images found[/]")
     else:
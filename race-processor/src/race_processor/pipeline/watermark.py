@@ -3,6 +3,7 @@ Applies copyright watermark to equirectangular images.
 Similar to how Google Street View adds "(c) Google Maps [year]" to each viewpoint.
 """
 
+import math
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -12,7 +13,7 @@ import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from rich.console import Console
 
-from ..config import CopyrightConfig
+from ..config import IMAGE_EXTENSIONS, CopyrightConfig
 
 console = Console()
 
@@ -45,16 +46,6 @@ def get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     return ImageFont.load_default()
 
 
-import math
-import cv2
-import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-from rich.console import Console
-
-from ..config import CopyrightConfig
-
-console = Console()
-
 # --- Watermark Constants ---
 DEFAULT_FONT_SIZE_RATIO = 0.014  # 1.4% of image height
 DEFAULT_X_PCT = 55.0           # Horizontal center-right
@@ -233,10 +224,9 @@ def process_watermark_batch(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Find all image files
-    image_extensions = {".jpg", ".jpeg", ".png", ".tiff", ".tif"}
     input_files = [
         f for f in input_dir.iterdir()
-        if f.suffix.lower() in image_extensions
+        if f.suffix.lower() in IMAGE_EXTENSIONS
     ]
 
     output_files = []
@@ -3,6 +3,7 @@ Geographic calculation utilities.
 """
 
 import math
+from typing import Optional
 
 
 def haversine_distance(
@@ -92,31 +93,33 @@ def calculate_image_headings(
     if n == 0:
         return
 
-    for i, img in enumerate(images):
-        lat = img.get(lat_key)
-        lon = img.get(lon_key)
+    coords = [(img.get(lat_key), img.get(lon_key)) for img in images]
+    has_gps = [lat is not None and lon is not None for lat, lon in coords]
+
+    # Nearest image with GPS before/after each position, found in two linear
+    # sweeps instead of scanning outwards from every image
+    prev_gps: list[Optional[int]] = [None] * n
+    last = None
+    for i in range(n):
+        prev_gps[i] = last
+        if has_gps[i]:
+            last = i
+
+    next_gps: list[Optional[int]] = [None] * n
+    last = None
+    for i in range(n - 1, -1, -1):
+        next_gps[i] = last
+        if has_gps[i]:
+            last = i
 
-        if lat is None or lon is None:
+    for i, img in enumerate(images):
+        if not has_gps[i]:
             # No GPS for this image, skip
             continue
 
-        # Get previous image with GPS
-        prev_lat, prev_lon = None, None
-        for j in range(i - 1, -1, -1):
-            plat = images[j].get(lat_key)
-            plon = images[j].get(lon_key)
-            if plat is not None and plon is not None:
-                prev_lat, prev_lon = plat, plon
-                break
-
-        # Get next image with GPS
-        next_lat, next_lon = None, None
-        for j in range(i + 1, n):
-            nlat = images[j].get(lat_key)
-            nlon = images[j].get(lon_key)
-            if nlat is not None and nlon is not None:
-                next_lat, next_lon = nlat, nlon
-                break
+        lat, lon = coords[i]
+        prev_lat, prev_lon = coords[prev_gps[i]] if prev_gps[i] is not None else (None, None)
+        next_lat, next_lon = coords[next_gps[i]] if next_gps[i] is not None else (None, None)
 
         # Calculate heading_to_prev (bearing FROM current TO previous)
         if prev_lat is not None and prev_lon is not None:
@@ -0,0 +1,48 @@
+"""
+Process pool helpers shared by the per-image pipeline stages.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+
+# Tasks each worker should get from Executor.map: several, so a slow chunk
+# does not leave the other workers idle at the end of a stage
+CHUNKS_PER_WORKER = 4
+
+
+def worker_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool for per-image OpenCV work.
+
+    Each process gets an equal share of the cores for OpenCV's own thread
+    pool so the workers together do not oversubscribe the machine.
+
+    Args:
+        workers: Number of worker processes
+
+    Returns:
+        Process pool with OpenCV threads set in every worker
+    """
+    max_workers = max(1, workers)
+    cv_threads = max(1, (os.cpu_count() or 1) // max_workers)
+    return ProcessPoolExecutor(
+        max_workers=max_workers, initializer=cv2.setNumThreads, initargs=(cv_threads,)
+    )
+
+
+def map_chunksize(item_count: int, workers: int) -> int:
+    """
+    Pick the Executor.map chunksize for a list of items.
+
+    Sending several items per task amortizes IPC on large directories.
+
+    Args:
+        item_count: Number of items to map
+        workers: Number of worker processes
+
+    Returns:
+        Items per task (at least 1)
+    """
+    return max(1, item_count // (CHUNKS_PER_WORKER * max(1, workers)))